@@ -16,6 +16,16 @@ from .server import mcp
 
 logger = logging.getLogger(__name__)
 
+_VALID_OUTPUT_FORMATS = frozenset({"json", "text"})
+
+_VALID_SAFESEARCH = frozenset({"on", "moderate", "off"})
+
+# Built once at import; only the query is interpolated per call
+_NO_RESULTS_TEXT = (
+    "No news results found for '{query}'. "
+    "Try broadening your search terms or check back later."
+)
+
 
 def _format_news_result(result: Dict[str, Any]) -> Dict[str, str]:
     """Transform a raw DuckDuckGo news result to the standard format."""
@@ -31,20 +41,20 @@ def _format_news_result(result: Dict[str, Any]) -> Dict[str, str]:
 def _format_news_as_text(results: List[Dict[str, str]], query: str) -> str:
     """Format news results as LLM-friendly natural language text."""
     if not results:
-        return (
-            f"No news results found for '{query}'. "
-            "Try broadening your search terms or check back later."
-        )
+        return _NO_RESULTS_TEXT.format(query=query)
 
     lines = [f"Found {len(results)} news results:\n"]
 
     for position, result in enumerate(results, start=1):
-        lines.append(f"{position}. {result.get('title', 'No title')}")
-        lines.append(f"   URL: {result.get('url', 'No URL')}")
-        lines.append(f"   Date: {result.get('date', 'Unknown')}")
-        lines.append(f"   Source: {result.get('source', 'Unknown')}")
-        lines.append(f"   Summary: {result.get('snippet', 'No summary available')}")
-        lines.append("")
+        # Direct indexing — _format_news_result guarantees every key.
+        # One entry per result (trailing \n yields the blank separator line).
+        lines.append(
+            f"{position}. {result['title'] or 'No title'}\n"
+            f"   URL: {result['url'] or 'No URL'}\n"
+            f"   Date: {result['date'] or 'Unknown'}\n"
+            f"   Source: {result['source'] or 'Unknown'}\n"
+            f"   Summary: {result['snippet'] or 'No summary available'}\n"
+        )
 
     return "\n".join(lines)
 
@@ -76,8 +86,7 @@ def search_duckduckgo_news(
     if not isinstance(max_results, int) or max_results <= 0:
         raise ValueError("max_results must be a positive integer")
 
-    valid_safesearch = ["on", "moderate", "off"]
-    if safesearch not in valid_safesearch:
+    if safesearch not in _VALID_SAFESEARCH:
         logger.warning(
             f"Invalid safesearch value: '{safesearch}'. Using 'moderate' instead."
         )
@@ -131,7 +140,7 @@ def duckduckgo_news_search(
             raise ValueError("max_results must be a valid positive integer")
 
     output_format = output_format.lower() if output_format else "json"
-    if output_format not in ("json", "text"):
+    if output_format not in _VALID_OUTPUT_FORMATS:
         logger.warning(
             f"Invalid output_format: '{output_format}'. Using 'json' instead."
         )
@@ -16,6 +16,17 @@ from .server import mcp
 
 logger = logging.getLogger(__name__)
 
+_VALID_OUTPUT_FORMATS = frozenset({"json", "text"})
+
+_VALID_SAFESEARCH = frozenset({"on", "moderate", "off"})
+
+# Built once at import; only the query is interpolated per call
+_NO_RESULTS_TEXT = (
+    "No results found for '{query}'. "
+    "This could be due to DuckDuckGo rate limiting, the query returning no matches, "
+    "or network issues. Try rephrasing your search or try again in a few minutes."
+)
+
 
 def _format_search_result(result: Dict) -> Dict[str, str]:
     """Transform a raw DuckDuckGo result to the standard format."""
@@ -38,19 +49,18 @@ def _format_results_as_text(results: List[Dict[str, str]], query: str) -> str:
         Formatted string with numbered results
     """
     if not results:
-        return (
-            f"No results found for '{query}'. "
-            "This could be due to DuckDuckGo rate limiting, the query returning no matches, "
-            "or network issues. Try rephrasing your search or try again in a few minutes."
-        )
+        return _NO_RESULTS_TEXT.format(query=query)
 
     lines = [f"Found {len(results)} search results:\n"]
 
     for position, result in enumerate(results, start=1):
-        lines.append(f"{position}. {result.get('title', 'No title')}")
-        lines.append(f"   URL: {result.get('url', 'No URL')}")
-        lines.append(f"   Summary: {result.get('snippet', 'No summary available')}")
-        lines.append("")  # Empty line between results
+        # Direct indexing — _format_search_result guarantees every key.
+        # One entry per result (trailing \n yields the blank separator line).
+        lines.append(
+            f"{position}. {result['title'] or 'No title'}\n"
+            f"   URL: {result['url'] or 'No URL'}\n"
+            f"   Summary: {result['snippet'] or 'No summary available'}\n"
+        )
 
     return "\n".join(lines)
 
@@ -94,7 +104,7 @@ def _try_fallback_search(
     safesearch: str,
     max_results: int,
     timeout: int,
-    original_error: Exception,
+    error_text: str,
 ) -> List[Dict[str, str]]:
     """
     Attempt a fallback search using the brave backend.
@@ -105,13 +115,13 @@ def _try_fallback_search(
         safesearch: Safe search setting
         max_results: Maximum number of results
         timeout: Request timeout in seconds
-        original_error: The original exception that triggered the fallback
+        error_text: Message of the original error that triggered the fallback
 
     Returns:
         List of formatted search results, or empty list on failure
     """
     # Don't retry if the error was already about the backend
-    if "backend" in str(original_error).lower():
+    if "backend" in error_text.lower():
         return []
 
     logger.info("Retrying with brave backend as fallback")
@@ -143,8 +153,7 @@ def _validate_search_params(query: str, max_results: int, safesearch: str) -> st
     if not isinstance(max_results, int) or max_results <= 0:
         raise ValueError("max_results must be a positive integer")
 
-    valid_safesearch = ["on", "moderate", "off"]
-    if safesearch not in valid_safesearch:
+    if safesearch not in _VALID_SAFESEARCH:
         logger.warning(
             f"Invalid safesearch value: '{safesearch}'. Using 'moderate' instead."
         )
@@ -180,8 +189,11 @@ def search_duckduckgo(
             query, region, safesearch, max_results, timeout, "duckduckgo"
         )
     except DDGSException as e:
-        logger.error(f"DuckDuckGo search error: {str(e)}")
-        return _try_fallback_search(query, region, safesearch, max_results, timeout, e)
+        error_text = str(e)
+        logger.error(f"DuckDuckGo search error: {error_text}")
+        return _try_fallback_search(
+            query, region, safesearch, max_results, timeout, error_text
+        )
     except Exception as e:
         logger.error(f"Unexpected error during search: {str(e)}")
         return []
@@ -216,7 +228,7 @@ def duckduckgo_search(
 
     # Validate output_format
     output_format = output_format.lower() if output_format else "json"
-    if output_format not in ("json", "text"):
+    if output_format not in _VALID_OUTPUT_FORMATS:
         logger.warning(
             f"Invalid output_format: '{output_format}'. Using 'json' instead."
         )